@@ -0,0 +1,166 @@
+"""
+Polling helpers for the Arduino OPTA web page.
+Every phase script reads the same page, so the connection and the
+patterns used to pull numbers out of it live here.
+"""
+import http.client
+import re
+import threading
+from urllib.parse import urlsplit
+
+
+# Values as rendered in the <h1>/<h2> of the OPTA page; anchored on the
+# tags so stray text elsewhere in the page can never match
+H1_RE = re.compile(rb"<h1[^>]*>\s*Bricks Cut:\s*(\d+)", re.I)
+H2_RE = re.compile(rb"<h2[^>]*>\s*Speed:\s*(\d+(?:\.\d+)?)", re.I)
+
+# One keep-alive connection per host, shared by every poll. A connection
+# carries one request at a time, so threads polling the same host (the
+# phase 2 plot fetches from both its logger and its animation) queue up
+# on the host's lock
+_connections = {}
+_host_locks = {}
+
+# Per URL (etag, last modified, body hash, bricks) from the last full
+# parse, so unchanged pages can be answered without parsing them again.
+# Shared by every poller, sync or async, through the helpers below
+_last_page = {}
+
+
+def _get(url: str, headers: dict | None = None):
+    """
+    GET url over the host's persistent connection.
+    Returns (status, headers, body). Only a request sent on a socket
+    left open by an earlier poll is retried, on a new connection, since
+    the server may have dropped it in between; an unreachable host
+    fails after a single connect timeout.
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    headers = {"Connection": "keep-alive", **(headers or {})}
+
+    # setdefault is atomic, so racing first calls still share one lock
+    with _host_locks.setdefault(parts.netloc, threading.Lock()):
+        while True:
+            conn = _connections.get(parts.netloc)
+            if conn is None:
+                conn_class = (
+                    http.client.HTTPSConnection
+                    if parts.scheme == "https"
+                    else http.client.HTTPConnection
+                )
+                conn = _connections[parts.netloc] = conn_class(
+                    parts.netloc, timeout=2
+                )
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                _connections.pop(parts.netloc, None)
+                if not reused:
+                    raise
+            else:
+                return response.status, response.headers, body
+
+
+def _check_status(url: str, status: int) -> None:
+    if status >= 400:
+        raise http.client.HTTPException(f"HTTP {status} from {url}")
+
+
+def fetch_page(url: str) -> bytes:
+    """
+    GET the OPTA page and return the raw response body.
+    Raises OSError or http.client.HTTPException on connection or HTTP
+    errors.
+    """
+    status, _, body = _get(url)
+    _check_status(url, status)
+    return body
+
+
+def parse_bricks(body: bytes) -> int:
+    """
+    Extract the bricks cut counter from a page body.
+    Raises ValueError if the counter is missing.
+    """
+    m = H1_RE.search(body)
+    if m is None:
+        raise ValueError("No bricks count found in response")
+    return int(m.group(1))
+
+
+def parse_speed(body: bytes) -> float:
+    """
+    Extract the cutting speed in bricks/min from a page body.
+    Raises ValueError if the speed is missing.
+    """
+    m = H2_RE.search(body)
+    if m is None:
+        raise ValueError("No speed found in response")
+    return float(m.group(1))
+
+
+def conditional_headers(url: str) -> dict:
+    """
+    Build the validators for a conditional GET of url.
+    Empty until a page from url has been remembered.
+    """
+    headers = {}
+    cached = _last_page.get(url)
+    if cached is not None:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def remembered_bricks(url: str, status: int, body: bytes) -> int | None:
+    """
+    Return the last count for url if the response shows the page is
+    unchanged (a 304, or a success with the same body), else None.
+    """
+    cached = _last_page.get(url)
+    if cached is None:
+        return None
+    if status == 304 or (200 <= status < 300 and hash(body) == cached[2]):
+        return cached[3]
+    return None
+
+
+def remember(url: str, headers, body: bytes, bricks: int) -> None:
+    """
+    Store a freshly parsed page's validators and count for url.
+    headers is any case-insensitive mapping of the response headers.
+    """
+    _last_page[url] = (
+        headers.get("ETag"),
+        headers.get("Last-Modified"),
+        hash(body),
+        bricks,
+    )
+
+
+def fetch_bricks(url: str) -> int:
+    """
+    Poll the OPTA page and return the bricks cut counter.
+    Sends a conditional GET and skips parsing on a 304 or when the
+    body is identical to the last one.
+    Raises on connection errors or an unexpected page.
+    """
+    status, response_headers, body = _get(url, conditional_headers(url))
+    bricks = remembered_bricks(url, status, body)
+    if bricks is not None:
+        return bricks
+    _check_status(url, status)
+
+    bricks = parse_bricks(body)
+    remember(url, response_headers, body, bricks)
+    return bricks
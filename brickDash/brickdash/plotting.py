@@ -0,0 +1,63 @@
+"""
+Plot helpers shared by the blitted BrickDash plots.
+They only work on the axes and artists passed in, so importing this
+module does not pull in matplotlib itself.
+"""
+from itertools import islice
+
+
+def set_limits(ax, xlim, ylim) -> bool:
+    """
+    Apply axis limits only when they differ from the current ones.
+    xlim may be None to leave the x axis alone.
+    Returns True if anything changed; blitting only repaints the
+    artists, so the figure then needs a full redraw.
+    """
+    changed = False
+    if xlim is not None and ax.get_xlim() != xlim:
+        ax.set_xlim(xlim)
+        changed = True
+    if ax.get_ylim() != ylim:
+        ax.set_ylim(ylim)
+        changed = True
+    return changed
+
+
+def newest_buckets(buckets, count: int) -> list:
+    """
+    Return the last count (label, [first, last, samples]) items of the
+    5 minute buckets, oldest first.
+    Walks back from the newest bucket instead of copying them all.
+    """
+    newest = list(islice(reversed(buckets.items()), count))
+    newest.reverse()
+    return newest
+
+
+def update_bars(ax, bars, tick_labels: list, buckets) -> bool:
+    """
+    Show the newest buckets as average bricks/min, one per bar.
+    Unused bars stay flat and unlabelled. tick_labels holds the labels
+    currently on the axis and is updated in place.
+    Returns True if the axes changed and the figure needs a full redraw.
+    """
+    newest = newest_buckets(buckets, len(bars))
+    heights = [
+        (last - first) / samples if samples > 1 else 0
+        for _, (first, last, samples) in newest
+    ]
+    labels = [label for label, _ in newest]
+    padding = len(bars) - len(newest)
+    heights += [0] * padding
+    labels += [""] * padding
+
+    for rect, height in zip(bars, heights):
+        rect.set_height(height)
+
+    redraw = False
+    if labels != tick_labels:
+        tick_labels[:] = labels
+        ax.set_xticklabels(labels, rotation=30, ha="right")
+        redraw = True
+    redraw |= set_limits(ax, None, (0, max(heights) + 1))
+    return redraw
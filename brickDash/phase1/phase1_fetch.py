@@ -1,24 +1,20 @@
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
 import time
 
+# Make the shared brickdash package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from brickdash.net import fetch_page, parse_bricks, parse_speed
+
 # Arduino OPTA Web Server URL
 URL = "http://192.168.20.75"
 
 def fetch_data():
     try:
-        # Send HTTP GET request
-        response = requests.get(URL, timeout=2)
-        response.raise_for_status()  # Raise error for bad responses
-
-        # Parse HTML using BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
-        h1 = soup.find('h1')
-        h2 = soup.find('h2')
-
-        # Extract numbers
-        bricks_cut = int(h1.text.strip().replace("Bricks Cut:", "").strip())
-        bricks_per_min = float(h2.text.strip().replace("Speed:", "").replace("bricks/min", "").strip())
+        # Single GET, both values pulled from the same raw body
+        body = fetch_page(URL)
+        bricks_cut = parse_bricks(body)
+        bricks_per_min = parse_speed(body)
 
         return bricks_cut, bricks_per_min
 
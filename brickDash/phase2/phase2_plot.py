@@ -1,21 +1,23 @@
-import requests
-from bs4 import BeautifulSoup
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+import matplotlib.ticker as ticker
+import os
+import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
 
+# Make the shared brickdash package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from brickdash.net import fetch_bricks
+
 URL = "http://192.168.20.75"
+MAX_POINTS = 60
 
 def fetch_data():
     try:
-        response = requests.get(URL, timeout=2)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        h1 = soup.find('h1')
-        bricks_cut = int(h1.text.strip().replace("Bricks Cut:", "").strip())
-        return bricks_cut
+        return fetch_bricks(URL)
     except Exception as e:
         print(f"[ERROR] {e}")
         return None
@@ -34,8 +36,8 @@ def log_to_console():
 threading.Thread(target=log_to_console, daemon=True).start()
 
 # ---- Real-time Plotting ----
-timestamps = []
-bricks_cut_values = []
+timestamps = deque(maxlen=MAX_POINTS)
+bricks_cut_values = deque(maxlen=MAX_POINTS)
 
 fig, ax = plt.subplots()
 line, = ax.plot([], [], lw=2)
@@ -43,20 +45,21 @@ ax.set_title("Bricks Cut Over Time")
 ax.set_xlabel("Time")
 ax.set_ylabel("Bricks Cut")
 
+# Fixed tick positions; frames only swap the label strings in place
+tick_labels = [''] * MAX_POINTS
+ax.set_xticks(range(MAX_POINTS))
+ax.set_xticklabels(tick_labels, rotation=45, ha='right')
+ax.xaxis.set_major_formatter(ticker.FixedFormatter(tick_labels))
+
 def update(frame):
     bricks = fetch_data()
     if bricks is not None:
         timestamps.append(datetime.now().strftime('%H:%M:%S'))
         bricks_cut_values.append(bricks)
 
-        if len(timestamps) > 60:
-            timestamps.pop(0)
-            bricks_cut_values.pop(0)
-
         line.set_data(range(len(bricks_cut_values)), bricks_cut_values)
         ax.set_xlim(0, len(bricks_cut_values))
-        ax.set_xticks(range(len(timestamps)))
-        ax.set_xticklabels(timestamps, rotation=45, ha='right')
+        tick_labels[:len(timestamps)] = timestamps
         ax.set_ylim(min(bricks_cut_values) - 1, max(bricks_cut_values) + 1)
         ax.relim()
         ax.autoscale_view()
@@ -3,15 +3,21 @@ from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-import requests
-from bs4 import BeautifulSoup
+from collections import OrderedDict, deque
 from datetime import datetime, date
 
 import threading
 import time
 
+import atexit
 import csv
 import os
+import sys
+
+# Make the shared brickdash package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from brickdash.net import fetch_bricks
+from brickdash.plotting import set_limits, update_bars
 
 # Set up logging path to use the existing brickDash/logs directory
 base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,34 +32,45 @@ if not os.path.isdir(log_dir):
 csv_filename = os.path.join(log_dir, f"brickdash_log_{date.today()}.csv")
 previous_logged_bricks = None
 
-# Create the file with headers only if it does not exist
+# Flush the buffered log to disk after this many rows
+CSV_FLUSH_ROWS = 10
+rows_since_flush = 0
+
+# Keep the log open for the whole session and write the header only if it is new
 file_exists = os.path.exists(csv_filename)
-with open(csv_filename, mode="a", newline="") as file:
-    writer = csv.writer(file)
-    if not file_exists:
-        writer.writerow(["timestamp", "brick_count"])
+csv_file = open(csv_filename, mode="a", newline="", buffering=8192)
+csv_writer = csv.writer(csv_file)
+if not file_exists:
+    csv_writer.writerow(["timestamp", "brick_count"])
+atexit.register(csv_file.close)
 
 
 # Phase 2.5 setup
 URL = "http://192.168.20.75"
+POLL_INTERVAL_SECONDS = 60
 MAX_POINTS = 60
-
-timestamps = []
-bricks_cut_values = []
-bricks_cut_per_hour = []
-bricks_per_5min = {}
+MAX_BARS = 10
+MAX_BUCKETS = 32
+
+# Every "HH:MM" 5 minute bucket label of the day, built once
+_BUCKETS = tuple(
+    f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, 5)
+)
+
+timestamps = deque(maxlen=MAX_POINTS)
+bricks_cut_values = deque(maxlen=MAX_POINTS)
+bricks_cut_per_hour = deque(maxlen=MAX_POINTS)
+bricks_per_5min = OrderedDict()
 start_time = None
 
+# Set by the logging thread whenever the buffers gain a sample
+new_data = threading.Event()
+
 
 # Fetch from web interface
 def fetch_data():
     try:
-        response = requests.get(URL, timeout=2)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        h1 = soup.find("h1")
-        bricks_cut = int(h1.text.strip().replace("Bricks Cut:", "").strip())
-        return bricks_cut
+        return fetch_bricks(URL)
     except Exception:
         return None
 
@@ -61,19 +78,25 @@ def fetch_data():
 # Logging thread (every 60 seconds)
 def log_to_console():
     global start_time
+    next_tick = time.monotonic()
     while True:
         bricks = fetch_data()
         if bricks is not None:
             now = datetime.now()
-            print(f"[Console Log] {now.strftime('%H:%M:%S')} | Bricks Cut: {bricks}")
-            timestamps.append(now.strftime("%H:%M:%S"))
+            # One format call serves both the CSV and the HH:MM:SS label
+            stamp = now.isoformat(sep=" ", timespec="seconds")
+            timestamp_str = stamp[11:]
+            print(f"[Console Log] {timestamp_str} | Bricks Cut: {bricks}")
+            timestamps.append(timestamp_str)
             bricks_cut_values.append(bricks)
 
-            global previous_logged_bricks
+            global previous_logged_bricks, rows_since_flush
             if previous_logged_bricks != bricks:
-                with open(csv_filename, mode="a", newline="") as file:
-                    writer = csv.writer(file)
-                    writer.writerow([now.strftime("%Y-%m-%d %H:%M:%S"), bricks])
+                csv_writer.writerow([stamp, bricks])
+                rows_since_flush += 1
+                if rows_since_flush >= CSV_FLUSH_ROWS:
+                    csv_file.flush()
+                    rows_since_flush = 0
                 previous_logged_bricks = bricks
 
             if start_time is None:
@@ -85,13 +108,21 @@ def log_to_console():
             else:
                 bricks_cut_per_hour.append(0)
 
-            minute = now.minute - (now.minute % 5)
-            bucket = f"{now.hour:02d}:{minute:02d}"
-            if bucket not in bricks_per_5min:
-                bricks_per_5min[bucket] = []
-            bricks_per_5min[bucket].append(bricks)
+            bucket = _BUCKETS[now.hour * 12 + now.minute // 5]
+            # Buckets only keep [first, last, samples], not every reading
+            summary = bricks_per_5min.get(bucket)
+            if summary is None:
+                bricks_per_5min[bucket] = [bricks, bricks, 1]
+                if len(bricks_per_5min) > MAX_BUCKETS:
+                    bricks_per_5min.popitem(last=False)
+            else:
+                summary[1] = bricks
+                summary[2] += 1
+
+            new_data.set()
 
-        time.sleep(60)
+        next_tick += POLL_INTERVAL_SECONDS
+        time.sleep(max(0.0, next_tick - time.monotonic()))
 
 
 # Tkinter GUI
@@ -115,9 +146,14 @@ ax2.set_title("Extrapolated Bricks Per Hour")
 ax2.set_ylabel("Bricks/hour")
 ax2.grid(True)
 
+# Bars are created once; frames only change their heights
+bars = ax3.bar(range(MAX_BARS), [0] * MAX_BARS)
+bar_tick_labels = [""] * MAX_BARS
 ax3.set_title("Bricks/min in 5 Minute Intervals")
 ax3.set_ylabel("Avg Bricks/min")
 ax3.set_xlabel("Time Blocks")
+ax3.set_xticks(range(MAX_BARS))
+ax3.set_xticklabels(bar_tick_labels, rotation=30, ha="right")
 ax3.grid(True)
 
 canvas = FigureCanvasTkAgg(fig, master=plot_frame)
@@ -126,43 +162,42 @@ canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
 
 # Real time update function
+def init_plot():
+    return (line1, line2, *bars)
+
 def update(frame):
-    if len(bricks_cut_values) == 0:
-        return line1, line2
+    artists = (line1, line2, *bars)
+
+    # Nothing to do until the logging thread delivers a new sample
+    if not new_data.is_set():
+        return artists
+    new_data.clear()
+
+    redraw = False
 
     # Subplot 1
-    recent_vals = bricks_cut_values[-MAX_POINTS:]
+    recent_vals = list(bricks_cut_values)
     line1.set_data(range(len(recent_vals)), recent_vals)
-    ax1.set_xlim(0, MAX_POINTS)
-    ax1.set_ylim(min(recent_vals) - 1, max(recent_vals) + 1)
+    redraw |= set_limits(ax1, (0, MAX_POINTS), (min(recent_vals) - 1, max(recent_vals) + 1))
 
     # Subplot 2
-    recent_hour = bricks_cut_per_hour[-MAX_POINTS:]
+    recent_hour = list(bricks_cut_per_hour)
     line2.set_data(range(len(recent_hour)), recent_hour)
-    ax2.set_xlim(0, MAX_POINTS)
-    ax2.set_ylim(0, max(recent_hour) + 10 if recent_hour else 10)
+    redraw |= set_limits(ax2, (0, MAX_POINTS), (0, max(recent_hour) + 10 if recent_hour else 10))
 
     # Subplot 3
-    bar_labels = list(bricks_per_5min.keys())[-10:]
-    bar_data = list(bricks_per_5min.values())[-10:]
-    bar_heights = [
-        (bucket[-1] - bucket[0]) / len(bucket) if len(bucket) > 1 else 0
-        for bucket in bar_data
-    ]
-    ax3.clear()
-    ax3.bar(bar_labels, bar_heights)
-    ax3.set_title("Bricks/min in 5 Minute Intervals")
-    ax3.set_ylabel("Avg Bricks/min")
-    ax3.set_xlabel("Time Blocks")
-    ax3.set_xticks(range(len(bar_labels)))
-    ax3.set_xticklabels(bar_labels, rotation=30, ha="right")
-    ax3.grid(True)
-
-    return line1, line2
+    redraw |= update_bars(ax3, bars, bar_tick_labels, bricks_per_5min)
+
+    if redraw:
+        fig.canvas.draw()
+
+    return artists
 
 
 # Animation
-ani = animation.FuncAnimation(fig, update, interval=1000, cache_frame_data=False)
+ani = animation.FuncAnimation(
+    fig, update, init_func=init_plot, interval=1000, blit=True, cache_frame_data=False
+)
 
 # Auto start background thread
 threading.Thread(target=log_to_console, daemon=True).start()
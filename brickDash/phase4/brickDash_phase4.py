@@ -2,24 +2,58 @@ import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import numpy as np
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
 
+from collections import OrderedDict
 from datetime import datetime, date
 from pathlib import Path
+from typing import TextIO
+import asyncio
 import threading
+import queue
 import time
+import atexit
 import csv
 import os
+import sys
+
+# Make the shared brickdash package importable when run as a script
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+from brickdash.net import (
+    conditional_headers,
+    parse_bricks,
+    remember,
+    remembered_bricks,
+)
+from brickdash.plotting import newest_buckets, set_limits
 
 
 # Configuration
 DEFAULT_URL = "http://192.168.20.75"
 POLL_INTERVAL_SECONDS = 60
 MAX_POINTS = 60
+MAX_BARS = 10
+MAX_BUCKETS = 32
 LOG_DIR_NAME = "brickDash_logs"
+CSV_BATCH_ROWS = 16
+CSV_FLUSH_SECONDS = 60
+
+# Every "HH:MM" 5 minute bucket label of the day, built once
+_BUCKETS = tuple(
+    f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, 5)
+)
+
+# Sample positions for the line plots; each frame takes a slice (a view)
+_X_AXIS = np.arange(MAX_POINTS, dtype=float)
+
+# One record per poll: raw counter and extrapolated rate. Both are
+# float64, the type matplotlib plots in, so the columns go to set_data
+# without a conversion; counts stay exact far beyond any real shift
+SAMPLE_DTYPE = np.dtype([("bricks", "f8"), ("rate", "f8")])
 
 
 def get_data_source_url() -> str:
@@ -30,10 +64,34 @@ def get_data_source_url() -> str:
     return os.getenv("BRICKDASH_URL", DEFAULT_URL)
 
 
-def init_log_file() -> Path:
+def create_client() -> httpx.AsyncClient:
+    """
+    Build the async HTTP client used for polling.
+    A small keep-alive pool lets every poll reuse the same socket, with
+    a short connect timeout so an unreachable PLC fails fast.
+    """
+    # httpx drops idle sockets after 5 s by default, well short of the
+    # poll interval, so hold the single connection open across polls
+    transport = httpx.AsyncHTTPTransport(
+        retries=1,
+        limits=httpx.Limits(
+            max_connections=1,
+            max_keepalive_connections=1,
+            keepalive_expiry=POLL_INTERVAL_SECONDS * 5,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={"Connection": "keep-alive"},
+        timeout=httpx.Timeout(2, connect=1),
+    )
+
+
+def init_log_file() -> tuple[Path, TextIO]:
     """
     Create a per user log directory in the home folder and
-    return the CSV file path for today's log.
+    open today's CSV log for appending.
+    Returns the CSV file path and the open, buffered file handle.
     """
     home_dir = Path.home()
     log_root = home_dir / LOG_DIR_NAME
@@ -42,12 +100,11 @@ def init_log_file() -> Path:
     csv_path = log_root / f"brickdash_log_{date.today()}.csv"
 
     file_exists = csv_path.exists()
-    with csv_path.open(mode="a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["timestamp", "brick_count"])
+    f = csv_path.open(mode="a", newline="", buffering=8192)
+    if not file_exists:
+        csv.writer(f).writerow(["timestamp", "brick_count"])
 
-    return csv_path
+    return csv_path, f
 
 
 class BrickDashApp:
@@ -56,104 +113,283 @@ class BrickDashApp:
         self.url = get_data_source_url()
 
         # Logging
-        self.csv_path = init_log_file()
+        self.csv_path, self.csv_file = init_log_file()
+        self.csv_writer = csv.writer(self.csv_file)
         self.previous_logged_bricks = None
 
-        # Data buffers
-        self.timestamps = []
-        self.bricks_cut_values = []
-        self.bricks_cut_per_hour = []
-        self.bricks_per_5min = {}
+        # Rows waiting for the CSV writer thread
+        self.log_queue = queue.Queue()
+        atexit.register(self._stop_csv_writer)
+
+        # Ring of the last MAX_POINTS samples; head is the next slot to
+        # write, which once the ring is full is also the oldest sample
+        self.samples = np.zeros(MAX_POINTS, dtype=SAMPLE_DTYPE)
+        self.sample_count = 0
+        self.head = 0
+        self.bricks_per_5min = OrderedDict()
         self.start_bricks = None
 
+        # Plot extremes, kept up to date as samples arrive
+        self.bricks_min = None
+        self.bricks_max = None
+        self.rate_max = None
+
+        # Read-only copies of the buffers for the GUI. Only the logging
+        # thread touches the buffers themselves; it rebinds these tuples
+        # after each sample, and a single attribute load never sees a
+        # half-built one, so no lock is needed
+        self.sample_snapshot = (self.samples[:0].copy(), None, None, None)
+        self.bucket_snapshot = ((), ())
+
+        # Set by the logging thread whenever the buffers gain a sample
+        self.new_data = threading.Event()
+
+        # Set once the window starts closing; the logging thread stops
+        # handing work to Tk from then on
+        self.closing = False
+
         # GUI setup
         self._build_gui()
 
         # Start background thread
         self._start_logging_thread()
 
-        # Start animation
-        self.ani = animation.FuncAnimation(
-            self.fig,
-            self.update_plots,
-            interval=1000,
-            cache_frame_data=False,
-        )
-
     # ---------- Data layer ----------
 
-    def fetch_data(self) -> int | None:
+    async def fetch_data(self, client: httpx.AsyncClient) -> int | None:
+        # Same conditional GET bookkeeping as brickdash.net.fetch_bricks:
+        # an unchanged page is answered without parsing it again
         try:
-            response = requests.get(self.url, timeout=2)
+            response = await client.get(
+                self.url, headers=conditional_headers(self.url)
+            )
+            bricks = remembered_bricks(
+                self.url, response.status_code, response.content
+            )
+            if bricks is not None:
+                return bricks
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            h1 = soup.find("h1")
-            if h1 is None:
-                raise ValueError("No <h1> element found in response")
-            bricks_cut = int(h1.text.strip().replace("Bricks Cut:", "").strip())
-            return bricks_cut
+            bricks = parse_bricks(response.content)
         except Exception as e:
             # Basic feedback in the GUI status label
-            self.status_var.set(f"Connection error: {e}")
+            self._set_status(f"Connection error: {e}")
             return None
 
-    def logging_loop(self) -> None:
+        remember(self.url, response.headers, response.content, bricks)
+        return bricks
+
+    async def logging_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with create_client() as client:
+            # Absolute deadlines keep the cadence from drifting by the
+            # time each fetch takes; the loop clock is monotonic
+            next_tick = loop.time()
+            while True:
+                bricks = await self.fetch_data(client)
+                if bricks is not None:
+                    self._record_sample(bricks)
+                next_tick += POLL_INTERVAL_SECONDS
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def _record_sample(self, bricks: int) -> None:
+        now = datetime.now()
+
+        # Format once: "YYYY-MM-DD HH:MM:SS" for the CSV, the time part
+        # for the console and plots
+        stamp = now.isoformat(sep=" ", timespec="seconds")
+        timestamp_str = stamp[11:]
+
+        # Log to CSV only if changed; the writer thread does the I/O
+        if self.previous_logged_bricks != bricks:
+            self.log_queue.put((stamp, bricks))
+            self.previous_logged_bricks = bricks
+
+        # Update console and buffers
+        print(f"[Console Log] {timestamp_str} | Bricks Cut: {bricks}")
+        self._set_status(f"Last update {timestamp_str} | Bricks Cut: {bricks}")
+
+        # Initial reference value
+        if self.start_bricks is None:
+            self.start_bricks = bricks
+
+        bucket = _BUCKETS[now.hour * 12 + now.minute // 5]
+
+        head = self.head
+        if self.sample_count == MAX_POINTS:
+            evicted_bricks, evicted_rate = self.samples[head].item()
+        else:
+            evicted_bricks = evicted_rate = None
+
+        # Rate per hour, from the sample just before this one
+        if self.sample_count:
+            rate = (bricks - int(self.samples["bricks"][head - 1])) * 60
+        else:
+            rate = 0
+
+        self.samples[head] = (bricks, rate)
+        self.head = (head + 1) % MAX_POINTS
+        self.sample_count = min(self.sample_count + 1, MAX_POINTS)
+        self._update_bricks_range(bricks, evicted_bricks)
+        self._update_rate_max(rate, evicted_rate)
+
+        # 5 minute bucket, kept as [first, last, samples] rather than
+        # every reading
+        summary = self.bricks_per_5min.get(bucket)
+        if summary is None:
+            self.bricks_per_5min[bucket] = [bricks, bricks, 1]
+            if len(self.bricks_per_5min) > MAX_BUCKETS:
+                self.bricks_per_5min.popitem(last=False)
+        else:
+            summary[1] = bricks
+            summary[2] += 1
+
+        self._publish_snapshots()
+
+        # Redraw as soon as the sample lands instead of polling for it
+        self.new_data.set()
+        self._call_in_gui(self._refresh_plots)
+
+    def _publish_snapshots(self) -> None:
+        # Unroll the ring oldest first; both line plots read their column
+        # straight out of this one copy
+        if self.sample_count < MAX_POINTS:
+            window = self.samples[: self.sample_count].copy()
+        else:
+            window = np.concatenate(
+                (self.samples[self.head :], self.samples[: self.head])
+            )
+        self.sample_snapshot = (
+            window,
+            self.bricks_min,
+            self.bricks_max,
+            self.rate_max,
+        )
+
+        buckets = newest_buckets(self.bricks_per_5min, MAX_BARS)
+        self.bucket_snapshot = (
+            tuple(label for label, _ in buckets),
+            tuple(tuple(summary) for _, summary in buckets),
+        )
+
+    def _valid_samples(self) -> np.ndarray:
+        # Filled part of the ring, in storage order
+        return self.samples[: self.sample_count]
+
+    def _update_bricks_range(self, added: int, evicted: float | None) -> None:
+        # Only rescan the window when the sample that fell out was an extreme
+        extremes = (self.bricks_min, self.bricks_max)
+        if evicted is not None and evicted in extremes:
+            bricks = self._valid_samples()["bricks"]
+            self.bricks_min = int(bricks.min())
+            self.bricks_max = int(bricks.max())
+        elif self.bricks_min is None:
+            self.bricks_min = self.bricks_max = added
+        else:
+            self.bricks_min = min(self.bricks_min, added)
+            self.bricks_max = max(self.bricks_max, added)
+
+    def _update_rate_max(self, added: float, evicted: float | None) -> None:
+        if evicted is not None and evicted == self.rate_max:
+            self.rate_max = float(self._valid_samples()["rate"].max())
+        elif self.rate_max is None or added > self.rate_max:
+            self.rate_max = added
+
+    def _set_status(self, text: str) -> None:
+        self._call_in_gui(self.status_var.set, text)
+
+    def _call_in_gui(self, callback, *args) -> None:
+        # Tk widgets belong to the main thread, so hand the call over. A
+        # sample recorded while the window is going away is not shown
+        if self.closing:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def csv_writer_loop(self) -> None:
+        # Rows are written in batches of CSV_BATCH_ROWS, or whatever has
+        # piled up once CSV_FLUSH_SECONDS have passed since the last write
+        pending = []
+        last_flush = time.monotonic()
         while True:
-            bricks = self.fetch_data()
-            if bricks is not None:
-                now = datetime.now()
-                timestamp_str = now.strftime("%H:%M:%S")
-
-                # Update console and buffers
-                print(f"[Console Log] {timestamp_str} | Bricks Cut: {bricks}")
-                self.status_var.set(
-                    f"Last update {timestamp_str} | Bricks Cut: {bricks}"
-                )
-
-                self.timestamps.append(timestamp_str)
-                self.bricks_cut_values.append(bricks)
-
-                # Log to CSV only if changed
-                if self.previous_logged_bricks != bricks:
-                    with self.csv_path.open(mode="a", newline="") as f:
-                        writer = csv.writer(f)
-                        writer.writerow(
-                            [now.strftime("%Y-%m-%d %H:%M:%S"), bricks]
-                        )
-                    self.previous_logged_bricks = bricks
-
-                # Initial reference value
-                if self.start_bricks is None:
-                    self.start_bricks = bricks
-
-                # Rate per hour
-                if len(self.bricks_cut_values) >= 2:
-                    diff = (
-                        self.bricks_cut_values[-1]
-                        - self.bricks_cut_values[-2]
-                    )
-                    self.bricks_cut_per_hour.append(diff * 60)
-                else:
-                    self.bricks_cut_per_hour.append(0)
-
-                # 5 minute bucket
-                minute = now.minute - (now.minute % 5)
-                bucket = f"{now.hour:02d}:{minute:02d}"
-                if bucket not in self.bricks_per_5min:
-                    self.bricks_per_5min[bucket] = []
-                self.bricks_per_5min[bucket].append(bricks)
-
-            time.sleep(POLL_INTERVAL_SECONDS)
+            try:
+                row = self.log_queue.get(timeout=CSV_FLUSH_SECONDS)
+            except queue.Empty:
+                pass
+            else:
+                if row is None:
+                    break
+                pending.append(row)
+
+            if pending and (
+                len(pending) >= CSV_BATCH_ROWS
+                or time.monotonic() - last_flush >= CSV_FLUSH_SECONDS
+            ):
+                self._write_rows(pending)
+                last_flush = time.monotonic()
+
+        self._write_rows(pending)
+        self.csv_file.close()
+
+    def _write_rows(self, rows: list) -> None:
+        self.csv_writer.writerows(rows)
+        self.csv_file.flush()
+        rows.clear()
 
     def _start_logging_thread(self) -> None:
-        t = threading.Thread(target=self.logging_loop, daemon=True)
+        self.writer_thread = threading.Thread(
+            target=self.csv_writer_loop, daemon=True
+        )
+        self.writer_thread.start()
+
+        # All network I/O runs on one asyncio loop in a single helper thread
+        self.poll_loop = asyncio.new_event_loop()
+        self.poll_task = self.poll_loop.create_task(self.logging_loop())
+        t = threading.Thread(target=self._run_poll_loop, daemon=True)
         t.start()
 
+    def _run_poll_loop(self) -> None:
+        try:
+            self.poll_loop.run_until_complete(self.poll_task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.poll_loop.close()
+
+            # This thread queues every CSV row, so once it is done the
+            # writer can drain and close the log without losing any
+            self._stop_csv_writer()
+
+    def _on_close(self) -> None:
+        if self.closing:
+            return
+        self.closing = True
+
+        # Cancelling the poll task exits the client's context, closing the
+        # pooled connection; the poll thread then stops the CSV writer
+        try:
+            self.poll_loop.call_soon_threadsafe(self.poll_task.cancel)
+        except RuntimeError:
+            # The loop has already finished and closed
+            pass
+
+        # pyplot still tracks the figure; release it with the window
+        plt.close(self.fig)
+        self.root.destroy()
+
+    def _stop_csv_writer(self) -> None:
+        # Let the writer drain any queued rows before the file is closed;
+        # safe to call twice since a finished thread joins immediately
+        self.log_queue.put(None)
+        self.writer_thread.join(timeout=2)
+
     # ---------- GUI layer ----------
 
     def _build_gui(self) -> None:
         self.root.title("BrickDash Phase 4 – Brick Cutting Monitor")
         self.root.geometry("1100x850")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -169,9 +405,18 @@ class BrickDashApp:
         )
         status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
-        # Matplotlib figure
-        self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(
-            3, 1, figsize=(10, 8)
+        # One tab per plot; only the plot on the selected tab is drawn
+        self.notebook = ttk.Notebook(main_frame)
+        for tab_title in ("Bricks Cut", "Bricks/Hour", "5 Minute Intervals"):
+            self.notebook.add(ttk.Frame(self.notebook), text=tab_title)
+        self.notebook.pack(fill=tk.X)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Matplotlib figure, the three plots share one canvas and one slot
+        self.fig = plt.figure(figsize=(10, 8))
+        grid = self.fig.add_gridspec(1, 1)
+        self.ax1, self.ax2, self.ax3 = (
+            self.fig.add_subplot(grid[0]) for _ in range(3)
         )
         self.fig.tight_layout()
 
@@ -185,59 +430,137 @@ class BrickDashApp:
         self.ax2.set_ylabel("Bricks/hour")
         self.ax2.grid(True)
 
+        # Bars are created once; frames only change their heights
+        self.bars = self.ax3.bar(range(MAX_BARS), [0] * MAX_BARS)
+        self.bar_labels = [""] * MAX_BARS
         self.ax3.set_title("Bricks/min in 5 Minute Intervals")
         self.ax3.set_ylabel("Avg Bricks/min")
         self.ax3.set_xlabel("Time Blocks")
+        self.ax3.set_xticks(range(MAX_BARS))
+        self.ax3.set_xticklabels(self.bar_labels, rotation=30, ha="right")
         self.ax3.grid(True)
 
+        # Data artists are blitted by hand, so full draws leave them out
+        self.plot_artists = [(self.line1,), (self.line2,), tuple(self.bars)]
+        for artists in self.plot_artists:
+            for artist in artists:
+                artist.set_animated(True)
+        self.background = None
+        self._show_plot(0)
+
         canvas = FigureCanvasTkAgg(self.fig, master=main_frame)
+        canvas.mpl_connect("draw_event", self._on_draw)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+    def _show_plot(self, index: int) -> None:
+        self.visible_plot = index
+        for i, ax in enumerate((self.ax1, self.ax2, self.ax3)):
+            ax.set_visible(i == index)
+            if i == index:
+                self.visible_ax = ax
+
+    def _on_tab_changed(self, event) -> None:
+        self._show_plot(self.notebook.index("current"))
+
+        # Switching plots needs a full draw anyway; bring the newly shown
+        # plot up to date first so that one draw covers both
+        self.update_plots()
+        self.fig.canvas.draw_idle()
+
+    def _on_draw(self, event) -> None:
+        # Every full draw (startup, resize, axes change) leaves out the
+        # animated artists: keep the clean background for blitting and
+        # paint the artists back on top
+        self.background = self.fig.canvas.copy_from_bbox(self.visible_ax.bbox)
+        self._draw_artists()
+
     # ---------- Plot updating ----------
 
-    def update_plots(self, frame):
-        if len(self.bricks_cut_values) == 0:
-            return self.line1, self.line2
-
-        # Plot 1: bricks cut
-        recent_vals = self.bricks_cut_values[-MAX_POINTS:]
-        self.line1.set_data(range(len(recent_vals)), recent_vals)
-        self.ax1.set_xlim(0, max(len(recent_vals), 10))
-        self.ax1.set_ylim(
-            min(recent_vals) - 1,
-            max(recent_vals) + 1,
+    def _draw_artists(self) -> None:
+        for artist in self.plot_artists[self.visible_plot]:
+            self.visible_ax.draw_artist(artist)
+
+    def _refresh_plots(self) -> None:
+        # Requests that pile up before the GUI gets to them share one redraw
+        if not self.new_data.is_set():
+            return
+        self.new_data.clear()
+
+        if self.update_plots():
+            # Ticks and grid moved; draw_idle folds this into Tk's next
+            # idle pass and _on_draw repaints the artists
+            self.fig.canvas.draw_idle()
+        else:
+            canvas = self.fig.canvas
+            canvas.restore_region(self.background)
+            self._draw_artists()
+            canvas.blit(self.visible_ax.bbox)
+
+    def update_plots(self) -> bool:
+        """
+        Push the latest data into the plot on the selected tab.
+        Returns True if its axes changed and the figure needs a full draw.
+        """
+        # Hidden plots are left stale and catch up when their tab is opened
+        if self.visible_plot == 0:
+            return self._update_bricks_plot()
+        if self.visible_plot == 1:
+            return self._update_rate_plot()
+        return self._update_bucket_plot()
+
+    def _update_bricks_plot(self) -> bool:
+        samples, low, high, _ = self.sample_snapshot
+        if not samples.size:
+            return False
+
+        recent_vals = samples["bricks"]
+
+        self.line1.set_data(_X_AXIS[: recent_vals.size], recent_vals)
+        return set_limits(
+            self.ax1,
+            (0, max(len(recent_vals), 10)),
+            (low - 1, high + 1),
         )
 
-        # Plot 2: rate per hour
-        recent_hour = self.bricks_cut_per_hour[-MAX_POINTS:]
-        self.line2.set_data(range(len(recent_hour)), recent_hour)
-        self.ax2.set_xlim(0, max(len(recent_hour), 10))
-        self.ax2.set_ylim(
-            0,
-            max(recent_hour) + 10 if recent_hour else 10,
-        )
+    def _update_rate_plot(self) -> bool:
+        samples, _, _, high = self.sample_snapshot
+        if not samples.size:
+            return False
 
-        # Plot 3: 5 minute buckets
-        bar_labels = list(self.bricks_per_5min.keys())[-10:]
-        bar_data = list(self.bricks_per_5min.values())[-10:]
-        bar_heights = [
-            (bucket_vals[-1] - bucket_vals[0]) / len(bucket_vals)
-            if len(bucket_vals) > 1
-            else 0
-            for bucket_vals in bar_data
-        ]
-
-        self.ax3.clear()
-        self.ax3.bar(bar_labels, bar_heights)
-        self.ax3.set_title("Bricks/min in 5 Minute Intervals")
-        self.ax3.set_ylabel("Avg Bricks/min")
-        self.ax3.set_xlabel("Time Blocks")
-        self.ax3.set_xticks(range(len(bar_labels)))
-        self.ax3.set_xticklabels(bar_labels, rotation=30, ha="right")
-        self.ax3.grid(True)
+        recent_hour = samples["rate"]
+
+        self.line2.set_data(_X_AXIS[: recent_hour.size], recent_hour)
+        return set_limits(
+            self.ax2,
+            (0, max(len(recent_hour), 10)),
+            (0, high + 10),
+        )
 
-        return self.line1, self.line2
+    def _update_bucket_plot(self) -> bool:
+        labels, bar_data = self.bucket_snapshot
+
+        # Unused bars stay flat and unlabelled
+        bar_heights = np.zeros(MAX_BARS)
+        if bar_data:
+            first, last, count = np.array(bar_data, dtype=float).T
+            np.divide(
+                last - first,
+                count,
+                out=bar_heights[: len(bar_data)],
+                where=count > 1,
+            )
+        bar_labels = list(labels) + [""] * (MAX_BARS - len(labels))
+
+        redraw = False
+        for rect, height in zip(self.bars, bar_heights):
+            rect.set_height(height)
+        if bar_labels != self.bar_labels:
+            self.bar_labels = bar_labels
+            self.ax3.set_xticklabels(bar_labels, rotation=30, ha="right")
+            redraw = True
+        redraw |= set_limits(self.ax3, None, (0, bar_heights.max() + 1))
+        return redraw
 
 
 def main():